@@ -14,17 +14,26 @@ Flow:
 7. Grant or deny tool access based on scopes
 """
 
+import asyncio
+import base64
+import hashlib
 import logging
 import os
-import json
-from typing import Dict, Any, Optional
-from datetime import datetime
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
 import httpx
-from functools import lru_cache
+import orjson
+from functools import lru_cache, partial
 import jwt
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on bearer length; real Okta access tokens are well under this
+MAX_TOKEN_LENGTH = 8192
+
 
 class OktaTokenValidator:
     """
@@ -60,7 +69,9 @@ class OktaTokenValidator:
         # Parse required scopes (space-separated, optional)
         # Token must contain ALL of these scopes
         required_scopes_str = os.getenv("OKTA_REQUIRED_SCOPES", "").strip()
-        self.required_scopes = set(required_scopes_str.split()) if required_scopes_str else set()
+        self.required_scopes = frozenset(required_scopes_str.split())
+        self._has_required = len(self.required_scopes) > 0
+        self._required_tuple = tuple(self.required_scopes)  # Scanned per token, no set build
         
         if not self.okta_domain:
             raise ValueError("OKTA_DOMAIN environment variable is required")
@@ -75,10 +86,78 @@ class OktaTokenValidator:
         self.issuer: Optional[str] = None
         self.discovery_metadata: Optional[Dict[str, Any]] = None
         
-        # Cache for JWKS keys (expires after 1 hour)
+        # Optional: skip discovery entirely when both values are provided
+        jwks_uri_override = os.getenv("OKTA_JWKS_URI", "").strip()
+        issuer_override = os.getenv("OKTA_ISSUER", "").strip()
+        if jwks_uri_override and issuer_override:
+            self.jwks_url = jwks_uri_override
+            self.issuer = issuer_override
+            self.discovery_metadata = {"jwks_uri": jwks_uri_override, "issuer": issuer_override}
+        
+        # Shared HTTP client (created lazily) so discovery and JWKS fetches
+        # reuse pooled keep-alive connections to the Okta domain
+        self._http: Optional[httpx.AsyncClient] = None
+        
+        # Single-flight guards so concurrent cache misses share one fetch
+        self._discovery_lock = asyncio.Lock()
+        self._jwks_lock = asyncio.Lock()
+        
+        # Cache for JWKS keys (expires after 1 hour, or the upstream
+        # Cache-Control max-age when Okta sends one)
         self._jwks_cache: Optional[Dict[str, Any]] = None
-        self._jwks_cache_time: Optional[datetime] = None
+        self._jwks_cache_deadline: float = 0.0  # time.monotonic() value
         self._jwks_cache_ttl = 3600  # 1 hour
+        # Bounds on the upstream lifetime so max-age=0 / no-cache can't make
+        # every request trigger a refresh, and a huge max-age can't pin keys
+        self._jwks_min_ttl = 60.0
+        self._jwks_max_ttl = 86400.0  # 1 day
+        
+        # Out-of-band refresh started when a stale JWKS is served
+        self._jwks_refresh_task: Optional["asyncio.Task[Optional[Dict[str, Any]]]"] = None
+        
+        # Validators for conditional JWKS revalidation (304 Not Modified)
+        self._jwks_etag: Optional[str] = None
+        self._jwks_last_modified: Optional[str] = None
+        
+        # Parsed public keys by kid, rebuilt whenever the cached JWKS is replaced,
+        # so each validation reuses ready-made cryptography key objects
+        self._pubkey_by_kid: Dict[str, Any] = {}
+        
+        # A kid missing from the JWKS triggers at most one forced refresh per
+        # cooldown, and kids still missing afterwards are remembered for the
+        # same period, so tokens with made-up kids can't drive Okta fetches
+        self._kid_refresh_cooldown = 60.0  # seconds
+        self._kid_refresh_after: float = 0.0  # time.monotonic() value
+        self._unknown_kids: Dict[str, float] = {}  # kid -> time.monotonic() expiry
+        self._unknown_kids_max = 1024
+        
+        # LRU cache of successful validations, keyed by token digest so raw
+        # tokens are never held in memory. Entries expire at min(exp, now + TTL).
+        # Set TOKEN_VALIDATION_CACHE=disabled to verify every request
+        self._cache_validations = os.getenv("TOKEN_VALIDATION_CACHE", "enabled").strip().lower() != "disabled"
+        self._validated: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._validated_max = 10000
+        self._validated_ttl = 300  # 5 minutes
+        
+        # Validations currently running, so concurrent requests carrying the
+        # same token await one verification instead of repeating it. Each runs
+        # as its own task, so a cancelled caller can't fail the others
+        self._inflight: Dict[bytes, "asyncio.Task[Optional[Dict[str, Any]]]"] = {}
+        
+        # jwt.decode with the static verification settings bound once, so the
+        # per-token call only passes the token and key. Audience is verified
+        # only if OKTA_AUDIENCE is set
+        verify_audience = bool(self.expected_audience)
+        self._decode = partial(
+            jwt.decode,
+            algorithms=["RS256"],
+            audience=self.expected_audience if verify_audience else None,
+            options={
+                "verify_signature": True,
+                "verify_exp": True,  # Verify expiration
+                "verify_aud": verify_audience   # Only verify audience if configured
+            }
+        )
         
         logger.info(f"OktaTokenValidator initializing: domain={self.okta_domain}, auth_server={self.authorization_server_id}")
         if self.expected_audience:
@@ -89,7 +168,56 @@ class OktaTokenValidator:
             logger.info(f"Required scopes: {', '.join(self.required_scopes)}")
         else:
             logger.info("Scope requirement validation disabled (OKTA_REQUIRED_SCOPES not set)")
-        logger.debug(f"Discovery endpoint: {self.discovery_url}")
+        if self.discovery_metadata is not None:
+            logger.info(f"Discovery skipped (OKTA_JWKS_URI and OKTA_ISSUER set): jwks_uri={self.jwks_url}")
+        else:
+            logger.debug(f"Discovery endpoint: {self.discovery_url}")
+    
+    async def _client(self) -> httpx.AsyncClient:
+        """Get or create the shared HTTP client for Okta requests"""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+                http2=True,
+            )
+        return self._http
+    
+    async def aclose(self):
+        """Close the shared HTTP client (call on application shutdown)"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    async def warm(self) -> bool:
+        """
+        Prefetch discovery metadata and JWKS (call during application startup).
+        
+        Keeps the two serial Okta round-trips off the first request's path.
+        
+        Returns:
+            True if both caches are populated, False otherwise
+        """
+        if not await self._load_discovery_metadata():
+            return False
+        return await self._get_jwks() is not None
+    
+    async def run_jwks_refresher(self, interval: float = 300):
+        """
+        Revalidate the JWKS every `interval` seconds until cancelled.
+        
+        Run as a background task so key rotation is picked up off the request
+        path; with ETag revalidation most refreshes are a cheap 304.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            await self._get_jwks(force_refresh=True)
+    
+    def _schedule_jwks_refresh(self):
+        """Start a background JWKS refresh unless one is already running"""
+        if self._jwks_refresh_task is None or self._jwks_refresh_task.done():
+            self._jwks_refresh_task = asyncio.get_running_loop().create_task(
+                self._get_jwks(force_refresh=True)
+            )
     
     async def _load_discovery_metadata(self) -> bool:
         """
@@ -106,44 +234,80 @@ class OktaTokenValidator:
                 logger.debug("Discovery metadata already loaded")
                 return True
             
-            logger.info(f"Fetching discovery metadata from {self.discovery_url}")
-            
-            async with httpx.AsyncClient() as client:
+            async with self._discovery_lock:
+                # Another coroutine may have loaded it while we waited
+                if self.discovery_metadata is not None:
+                    return True
+                
+                logger.info(f"Fetching discovery metadata from {self.discovery_url}")
+                
+                client = await self._client()
                 response = await client.get(self.discovery_url, timeout=10)
                 response.raise_for_status()
                 
-            self.discovery_metadata = response.json()
-            
-            # Extract critical values
-            self.jwks_url = self.discovery_metadata.get("jwks_uri")
-            self.issuer = self.discovery_metadata.get("issuer")
-            
-            if not self.jwks_url:
-                logger.error("Discovery endpoint missing 'jwks_uri'")
-                return False
-            
-            if not self.issuer:
-                logger.error("Discovery endpoint missing 'issuer'")
-                return False
-            
-            logger.info(f"Discovery successful: issuer={self.issuer}, jwks_uri={self.jwks_url}")
-            return True
+                self.discovery_metadata = orjson.loads(response.content)
+                
+                # Extract critical values
+                self.jwks_url = self.discovery_metadata.get("jwks_uri")
+                self.issuer = self.discovery_metadata.get("issuer")
+                
+                if not self.jwks_url:
+                    logger.error("Discovery endpoint missing 'jwks_uri'")
+                    return False
+                
+                if not self.issuer:
+                    logger.error("Discovery endpoint missing 'issuer'")
+                    return False
+                
+                logger.info(f"Discovery successful: issuer={self.issuer}, jwks_uri={self.jwks_url}")
+                return True
             
         except Exception as e:
             logger.error(f"Failed to load discovery metadata: {e}")
             return False
     
-    async def _get_jwks(self) -> Optional[Dict[str, Any]]:
+    def _jwks_ttl_from(self, response: httpx.Response) -> float:
+        """
+        Cache lifetime for a JWKS response: Cache-Control max-age, else the
+        default TTL, clamped to [_jwks_min_ttl, _jwks_max_ttl].
+        
+        no-cache / no-store get the minimum, so the keys are revalidated
+        often but not on every request.
+        """
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if "no-store" in cache_control or "no-cache" in cache_control:
+            return self._jwks_min_ttl
+        match = re.search(r"max-age=(\d+)", cache_control)
+        ttl = float(match.group(1)) if match else float(self._jwks_cache_ttl)
+        return min(max(ttl, self._jwks_min_ttl), self._jwks_max_ttl)
+    
+    async def _get_jwks(self, force_refresh: bool = False) -> Optional[Dict[str, Any]]:
         """
         Fetch Okta JWKS for token verification.
         
         JWKS URL is discovered from the authorization server metadata.
-        Results are cached for 1 hour to reduce API calls.
+        Results are cached for 1 hour to reduce API calls. Once expired, the
+        cached keys are still served for up to another TTL while a background
+        refresh runs, so validation only waits on Okta when there is no cache.
         
+        Args:
+            force_refresh: Bypass the cache (e.g. after a kid miss on key rotation)
+            
         Returns:
             Dict with 'keys' array, or None if fetch fails
         """
         try:
+            # Serve from cache while within TTL, or stale while revalidating
+            if not force_refresh and self._jwks_cache is not None:
+                now = time.monotonic()
+                if now < self._jwks_cache_deadline:
+                    logger.debug("Using cached JWKS")
+                    return self._jwks_cache
+                if now < self._jwks_cache_deadline + self._jwks_cache_ttl:
+                    logger.debug("Using stale JWKS while refreshing in background")
+                    self._schedule_jwks_refresh()
+                    return self._jwks_cache
+            
             # Ensure discovery metadata is loaded
             if not await self._load_discovery_metadata():
                 logger.error("Cannot fetch JWKS: discovery metadata not available")
@@ -153,12 +317,42 @@ class OktaTokenValidator:
                 logger.error("JWKS URL not available from discovery metadata")
                 return None
             
-            logger.debug(f"Fetching JWKS from {self.jwks_url}")
-            
-            async with httpx.AsyncClient() as client:
-                response = await client.get(self.jwks_url, timeout=10)
+            seen_deadline = self._jwks_cache_deadline
+            async with self._jwks_lock:
+                # Re-check: another coroutine may have refreshed while we waited
+                if self._jwks_cache is not None and self._jwks_cache_deadline != seen_deadline:
+                    return self._jwks_cache
+                
+                logger.debug(f"Fetching JWKS from {self.jwks_url}")
+                
+                # Revalidate the cached copy instead of re-downloading it
+                headers = {}
+                if self._jwks_cache is not None:
+                    if self._jwks_etag:
+                        headers["If-None-Match"] = self._jwks_etag
+                    if self._jwks_last_modified:
+                        headers["If-Modified-Since"] = self._jwks_last_modified
+                
+                client = await self._client()
+                response = await client.get(self.jwks_url, headers=headers, timeout=10)
+                
+                if response.status_code == 304 and self._jwks_cache is not None:
+                    self._jwks_cache_deadline = time.monotonic() + self._jwks_ttl_from(response)
+                    logger.debug("JWKS not modified, extended cache lifetime")
+                    return self._jwks_cache
+                
                 response.raise_for_status()
-                jwks = response.json()
+                jwks = orjson.loads(response.content)
+                
+                # Parse keys once per fetch, then populate cache
+                self._pubkey_by_kid = {
+                    jwk.key_id: jwk.key for jwk in jwt.PyJWKSet.from_dict(jwks).keys if jwk.key_id
+                }
+                self._jwks_cache = jwks
+                self._jwks_cache_deadline = time.monotonic() + self._jwks_ttl_from(response)
+                self._jwks_etag = response.headers.get("ETag")
+                self._jwks_last_modified = response.headers.get("Last-Modified")
+                
                 logger.info(f"JWKS fetched successfully: {len(jwks.get('keys', []))} keys")
                 return jwks
                 
@@ -166,25 +360,7 @@ class OktaTokenValidator:
             logger.error(f"Failed to fetch JWKS: {e}")
             return None
     
-    def _get_signing_key(self, jwks: Dict[str, Any], kid: str) -> Optional[Dict[str, Any]]:
-        """
-        Find signing key by kid (key ID) in JWKS.
-        
-        Args:
-            jwks: JWKS response from Okta
-            kid: Key ID from token header
-            
-        Returns:
-            Key dict, or None if not found
-        """
-        keys = jwks.get("keys", [])
-        for key in keys:
-            if key.get("kid") == kid:
-                return key
-        logger.warning(f"Signing key not found for kid: {kid}")
-        return None
-    
-    def _validate_required_scopes(self, token_claims: Dict[str, Any]) -> bool:
+    def _validate_required_scopes(self, scope: Any) -> bool:
         """
         Validate that token contains all required scopes.
         
@@ -192,34 +368,62 @@ class OktaTokenValidator:
         as a space-separated list. Token must contain ALL of them.
         
         Args:
-            token_claims: Decoded token claims with 'scope' field
+            scope: Token scope, as a space-separated string or an array
             
         Returns:
             True if all required scopes present, False otherwise
         """
-        if not self.required_scopes:
+        if not self._has_required:
             # No required scopes configured
             return True
         
-        scope = token_claims.get("scope", "")
-        
         # Handle scope as either space-separated string or array
         if isinstance(scope, list):
-            token_scopes = set(scope)
+            token_scopes = scope
         elif isinstance(scope, str):
-            token_scopes = set(scope.split()) if scope else set()
+            token_scopes = scope.split()
         else:
-            token_scopes = set()
+            token_scopes = []
         
-        # Check if all required scopes are present (required is subset of token scopes)
-        if self.required_scopes.issubset(token_scopes):
+        # Check if all required scopes are present. Required scopes are few
+        # (typically 1-3), so scanning the token's list beats building a set
+        if all(required in token_scopes for required in self._required_tuple):
             logger.info(f"Required scopes validation PASSED (required: {self.required_scopes}, token: {token_scopes})")
             return True
         else:
-            missing_scopes = self.required_scopes - token_scopes
+            missing_scopes = self.required_scopes.difference(token_scopes)
             logger.warning(f"Required scopes validation FAILED (required: {self.required_scopes}, missing: {missing_scopes}, token: {token_scopes})")
             return False
     
+    async def _signing_key_after_refresh(self, kid: str) -> Optional[Any]:
+        """
+        Look up a kid missing from the cached JWKS, refreshing it if allowed.
+        
+        Okta may have rotated keys, so an unknown kid forces a JWKS refresh,
+        but at most once per cooldown (a refresh already in flight is joined
+        instead). Kids still missing after a refresh are cached negatively
+        for the cooldown. The current keys stay cached if the refresh fails.
+        """
+        now = time.monotonic()
+        if self._unknown_kids.get(kid, 0.0) > now:
+            logger.debug(f"Kid recently confirmed unknown: {kid}")
+            return None
+        
+        if now < self._kid_refresh_after and not self._jwks_lock.locked():
+            logger.debug(f"JWKS refresh for unknown kid is cooling down: {kid}")
+            return None
+        
+        logger.info(f"Refreshing JWKS for unknown kid: {kid}")
+        self._kid_refresh_after = now + self._kid_refresh_cooldown
+        await self._get_jwks(force_refresh=True)
+        
+        signing_key = self._pubkey_by_kid.get(kid)
+        if signing_key is None:
+            if len(self._unknown_kids) >= self._unknown_kids_max:
+                self._unknown_kids.clear()
+            self._unknown_kids[kid] = time.monotonic() + self._kid_refresh_cooldown
+        return signing_key
+    
     async def validate_token(self, token: str) -> Optional[Dict[str, Any]]:
         """
         Validate Okta MCP access token using discovered metadata.
@@ -235,18 +439,24 @@ class OktaTokenValidator:
         The audience is automatically derived from the OAuth 2.0 issuer
         in the discovery endpoint, so no manual audience configuration needed.
         
+        Successful results are cached by token digest until the token expires
+        (at most 5 minutes), so repeat calls skip signature verification.
+        Disable with TOKEN_VALIDATION_CACHE=disabled.
+        
         Args:
             token: The MCP access token from Authorization header
             
         Returns:
-            Dict with token claims if valid:
+            Decoded token claims if valid, with "valid" set and "scope"
+            normalized to a space-separated string:
             {
                 "valid": True,
                 "sub": "user_id",
                 "aud": "audience",
                 "scope": "mcp:read mcp:write",
                 "exp": 1234567890,
-                "iss": "https://..."
+                "iss": "https://...",
+                ...  # all other token claims
             }
             Or None if invalid
         """
@@ -255,128 +465,148 @@ class OktaTokenValidator:
                 logger.warning("Empty token provided")
                 return None
             
-            # Ensure discovery metadata is loaded (for audience)
-            if not await self._load_discovery_metadata():
-                logger.error("Cannot validate token: discovery metadata not available")
+            # Reject obviously malformed bearers before any hashing, I/O or crypto
+            if len(token) > MAX_TOKEN_LENGTH or token.count(".") != 2 or not token.isascii():
+                logger.warning("Malformed token: expected a JWT with 3 segments")
                 return None
             
-            # Decode token header to get kid (key ID)
-            try:
-                header = jwt.get_unverified_header(token)
-                kid = header.get("kid")
-                if not kid:
-                    logger.error("Token missing 'kid' in header")
-                    return None
-            except Exception as e:
-                logger.error(f"Invalid token format: {e}")
-                return None
+            # Serve repeat tokens from the validation cache
+            cache_key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+            cached = self._validated.get(cache_key) if self._cache_validations else None
+            if cached is not None:
+                if cached[0] > time.time():
+                    self._validated.move_to_end(cache_key)
+                    logger.debug("Token validation cache hit")
+                    return cached[1]
+                del self._validated[cache_key]
             
-            # Fetch JWKS (cached)
-            jwks = await self._get_jwks()
-            if not jwks:
-                logger.error("Failed to fetch JWKS for validation")
-                return None
+            # Coalesce concurrent validations of the same token onto one verification
+            task = self._inflight.get(cache_key)
+            if task is not None:
+                logger.debug("Joining in-flight validation for token")
+            else:
+                task = asyncio.get_running_loop().create_task(self._verify_token(token, cache_key))
+                self._inflight[cache_key] = task
+                task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+            return await asyncio.shield(task)
+                
+        except Exception as e:
+            logger.error(f"Token validation error: {e}")
+            import traceback
+            logger.debug(f"Traceback: {traceback.format_exc()}")
+            return None
+    
+    async def _verify_token(self, token: str, cache_key: bytes) -> Optional[Dict[str, Any]]:
+        """
+        Verify token signature and claims against the Okta JWKS.
+        
+        Called by validate_token once cheap checks and cache lookups miss.
+        Successful results are stored in the validation cache under cache_key.
+        
+        Args:
+            token: The MCP access token
+            cache_key: Digest of the token used as validation cache key
             
-            # Get signing key
-            signing_key = self._get_signing_key(jwks, kid)
-            if not signing_key:
-                logger.error(f"Signing key not found for kid: {kid}")
+        Returns:
+            Decoded token claims if valid, None otherwise
+        """
+        # Ensure discovery metadata is loaded (for audience)
+        if not await self._load_discovery_metadata():
+            logger.error("Cannot validate token: discovery metadata not available")
+            return None
+        
+        # Decode token header to get kid (key ID)
+        # Only 'kid' is needed, so decode the first segment directly
+        try:
+            segment, _, _ = token.partition(".")
+            header = orjson.loads(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+            kid = header.get("kid")
+            if not kid:
+                logger.error("Token missing 'kid' in header")
                 return None
+        except Exception as e:
+            logger.error(f"Invalid token format: {e}")
+            return None
+        
+        # Fetch JWKS (cached)
+        jwks = await self._get_jwks()
+        if not jwks:
+            logger.error("Failed to fetch JWKS for validation")
+            return None
+        
+        # Get signing key (O(1) lookup of the pre-parsed key)
+        signing_key = self._pubkey_by_kid.get(kid)
+        if signing_key is None:
+            signing_key = await self._signing_key_after_refresh(kid)
+        if signing_key is None:
+            logger.error(f"Signing key not found for kid: {kid}")
+            return None
+        
+        # Verify token signature and claims
+        decoded = None  # Initialize here for exception handling
+        
+        try:
+            # Verify token in a worker thread: RSA verification is CPU-bound and
+            # cryptography releases the GIL, so it runs off the event loop
+            decoded = await asyncio.to_thread(self._decode, token, signing_key)
             
-            # Verify token signature and claims
-            decoded = None  # Initialize here for exception handling
+            # Extract scope from either 'scope' or 'scp' claim
+            # 'scp' is standard Okta format (array), 'scope' is standard OAuth format
+            scope = decoded.get("scope") or decoded.get("scp") or ""
+            if isinstance(scope, list):
+                scope = " ".join(scope)
             
-            try:
-                # Create PEM public key from JWK
-                public_key = jwt.algorithms.RSAAlgorithm.from_jwk(json.dumps(signing_key))
-                
-                # Determine whether to verify audience
-                verify_audience = bool(self.expected_audience)
-                expected_audience = self.expected_audience if verify_audience else None
-                
-                if verify_audience:
-                    logger.debug(f"Validating token with audience: {expected_audience}")
-                else:
-                    logger.debug("Validating token without audience check")
-                
-                # Verify token
-                decoded = jwt.decode(
-                    token,
-                    public_key,
-                    algorithms=["RS256"],
-                    audience=expected_audience,  # Only verify if OKTA_AUDIENCE is set
-                    options={
-                        "verify_signature": True,
-                        "verify_exp": True,  # Verify expiration
-                        "verify_aud": verify_audience   # Only verify audience if configured
-                    }
-                )
-                
-                # Extract scope from either 'scope' or 'scp' claim
-                # 'scp' is standard Okta format, 'scope' is standard OAuth format
-                scope = decoded.get("scope")
-                scp = decoded.get("scp")
-                
-                # Convert scp array to space-separated string if present
-                if scp and not scope:
-                    if isinstance(scp, list):
-                        scope = " ".join(scp)
-                    else:
-                        scope = str(scp)
-                
-                scope = scope or ""
-                
-                # Store normalized scope back in decoded for required scopes validation
-                decoded["scope"] = scope
-                
-                # Validate required scopes
-                if not self._validate_required_scopes(decoded):
-                    logger.warning("Token does not contain all required scopes")
-                    return None
-                
-                logger.info(f"Token validated successfully: sub={decoded.get('sub')}, scope={scope}, aud={decoded.get('aud')}")
-                
-                return {
-                    "valid": True,
-                    "sub": decoded.get("sub"),
-                    "aud": decoded.get("aud"),
-                    "scope": scope,  # Normalized scope (space-separated string or from scp array)
-                    "exp": decoded.get("exp"),
-                    "iss": decoded.get("iss"),
-                    "claims": decoded  # Full claims for detailed authorization
-                }
-                
-            except jwt.ExpiredSignatureError:
-                logger.warning("Token has expired")
+            # Validate required scopes
+            if not self._validate_required_scopes(scope):
+                logger.warning("Token does not contain all required scopes")
                 return None
-            except jwt.InvalidAudienceError:
-                aud_value = decoded.get('aud') if decoded else "unknown"
-                logger.warning(f"Invalid audience. Expected: {expected_audience}, got: {aud_value}")
-                logger.warning(f"Set OKTA_AUDIENCE environment variable to the expected audience")
-                return None
-            except jwt.InvalidSignatureError:
-                logger.error("Invalid token signature")
-                return None
-            except Exception as e:
-                logger.error(f"Token verification failed: {e}")
-                return None
-                
+            
+            logger.info(f"Token validated successfully: sub={decoded.get('sub')}, scope={scope}, aud={decoded.get('aud')}")
+            
+            # Return the decoded claims themselves, with scope normalized to a
+            # space-separated string for permission checks downstream
+            decoded["scope"] = scope
+            decoded["valid"] = True
+            
+            # Cache until token expiry, bounded by the cache TTL
+            if self._cache_validations:
+                expires_at = time.time() + self._validated_ttl
+                if isinstance(decoded.get("exp"), (int, float)):
+                    expires_at = min(decoded["exp"], expires_at)
+                self._validated[cache_key] = (expires_at, decoded)
+                if len(self._validated) > self._validated_max:
+                    self._validated.popitem(last=False)
+            
+            return decoded
+        
+        except jwt.ExpiredSignatureError:
+            logger.warning("Token has expired")
+            return None
+        except jwt.InvalidAudienceError:
+            aud_value = decoded.get('aud') if decoded else "unknown"
+            logger.warning(f"Invalid audience. Expected: {self.expected_audience}, got: {aud_value}")
+            logger.warning(f"Set OKTA_AUDIENCE environment variable to the expected audience")
+            return None
+        except jwt.InvalidSignatureError:
+            logger.error("Invalid token signature")
+            return None
         except Exception as e:
-            logger.error(f"Token validation error: {e}")
-            import traceback
-            logger.debug(f"Traceback: {traceback.format_exc()}")
+            logger.error(f"Token verification failed: {e}")
             return None
 
 
 # Global validator instance
 _validator: Optional[OktaTokenValidator] = None
+_validator_lock = threading.Lock()
 
 
 def get_validator() -> OktaTokenValidator:
-    """Get or create global validator instance"""
+    """Get or create global validator instance (thread-safe)"""
     global _validator
     if _validator is None:
-        _validator = OktaTokenValidator()
+        with _validator_lock:
+            if _validator is None:
+                _validator = OktaTokenValidator()
     return _validator
 
 
@@ -396,14 +626,14 @@ async def validate_authorization_header(authorization_header: Optional[str]) ->
         logger.warning("Missing Authorization header")
         return None
     
-    # Parse Bearer token
-    parts = authorization_header.split()
-    if len(parts) != 2 or parts[0].lower() != "bearer":
-        logger.warning(f"Invalid Authorization header format: {parts[0] if parts else 'empty'}")
+    # Parse "<scheme> <token>", separated by any whitespace
+    parts = authorization_header.split(None, 1)
+    scheme = parts[0] if parts else ""
+    token = parts[1].strip() if len(parts) == 2 else ""
+    if scheme.lower() != "bearer" or not token or len(token.split(None, 1)) != 1:
+        # Cap what gets logged: a malformed header may have the token glued on
+        logger.warning(f"Invalid Authorization header format: {scheme[:16] or 'empty'}")
         return None
     
-    token = parts[1]
-    
     # Validate token
-    validator = get_validator()
-    return await validator.validate_token(token)
+    return await get_validator().validate_token(token)
@@ -21,12 +21,214 @@ MCP Tools Available:
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+import sys
+import threading
+import orjson
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple, Union
 from datetime import datetime
-import json
 
 logger = logging.getLogger(__name__)
 
+# OAuth scope names (interned; "mcp:*" literals are not interned automatically)
+_MCP_READ = sys.intern("mcp:read")
+_MCP_WRITE = sys.intern("mcp:write")
+_READ_DATA = sys.intern("read_data")
+_WRITE_DATA = sys.intern("write_data")
+
+# Permission -> OAuth scopes, any one of which grants it
+_PERMISSION_SCOPE_MAP = {
+    "view_employee_list": frozenset({_READ_DATA, _MCP_READ}),
+    "view_employee_details": frozenset({_READ_DATA, _MCP_READ}),
+    "view_salary_info": frozenset({_READ_DATA, _MCP_READ}),
+    "edit_employee": frozenset({_WRITE_DATA, _MCP_WRITE}),
+    "delete_employee": frozenset({_WRITE_DATA, _MCP_WRITE})
+}
+
+# Employee fields whose values repeat across records; interned at load
+_INTERNED_EMPLOYEE_FIELDS = ("department", "title", "manager", "status", "location", "salary_band", "access_level", "team")
+
+# Accepted list_employees status_filter values
+_VALID_STATUS = frozenset({"Active", "Inactive", "All"})
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only proxies and turn lists into tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def json_default(obj: Any) -> Any:
+    """JSON encoder hook for the read-only proxies in shared tool responses"""
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+@lru_cache(maxsize=1024)
+def _scope_grants(permission: str, scope: Union[str, Tuple[str, ...]]) -> bool:
+    """
+    Check whether a token scope grants a known permission.
+    
+    The answer depends only on the permission and the scope value, so it is
+    memoized; tokens carrying the same scope share one entry.
+    """
+    token_scopes = map(sys.intern, scope.split()) if isinstance(scope, str) else scope
+    return not _PERMISSION_SCOPE_MAP[permission].isdisjoint(token_scopes)
+
+# MCP tool definitions, shared by every EmployeesMCP instance. Frozen so no
+# caller can alter them; encoders need json_default for the proxies
+_TOOLS: Tuple[Mapping[str, Any], ...] = _freeze([
+    {
+        "name": "list_employees",
+        "description": "List all active employees with their basic information (department, title, manager). Requires mcp:read scope.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "status_filter": {
+                    "type": "string",
+                    "enum": ["Active", "Inactive", "All"],
+                    "description": "Filter employees by status. Default: Active",
+                    "default": "Active"
+                }
+            }
+        }
+    },
+    {
+        "name": "get_employee_info",
+        "description": "Get detailed information about a specific employee by name or employee ID. Requires mcp:read scope.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "employee_identifier": {
+                    "type": "string",
+                    "description": "Employee name (e.g., 'John Smith') or employee ID (e.g., 'EMP001')"
+                }
+            },
+            "required": ["employee_identifier"]
+        }
+    },
+    {
+        "name": "get_department_info",
+        "description": "Get overview information about all departments including head, employee count, budget, and location.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "department_name": {
+                    "type": "string",
+                    "description": "Optional: Specific department name. If not provided, returns all departments.",
+                    "enum": ["Engineering", "Finance", "HR", "Legal", "Product", "Marketing", "Sales", None]
+                }
+            }
+        }
+    },
+    {
+        "name": "get_benefits_info",
+        "description": "Get information about available employee benefits and enrollment statistics.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    },
+    {
+        "name": "get_salary_info",
+        "description": "Get salary band distribution information. Requires mcp:read scope.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    },
+    {
+        "name": "get_onboarding_info",
+        "description": "Get information about the employee onboarding process and steps.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {}
+        }
+    }
+])
+
+# Static get_onboarding_info payload
+_ONBOARDING_RESPONSE: Dict[str, Any] = {
+    "onboarding_process": {
+        "pre_boarding": {
+            "timeline": "1 week before start date",
+            "steps": [
+                "Send welcome email with company information",
+                "Set up IT accounts and access",
+                "Schedule orientation session"
+            ]
+        },
+        "first_day": {
+            "steps": [
+                "Complete HR paperwork",
+                "IT setup and equipment assignment",
+                "Department introduction"
+            ]
+        },
+        "first_week": {
+            "steps": [
+                "Training sessions",
+                "Buddy assignment",
+                "Goal setting meeting"
+            ]
+        },
+        "first_month": {
+            "steps": [
+                "Regular check-ins",
+                "Performance review setup",
+                "Benefits enrollment"
+            ]
+        }
+    }
+}
+
+# Employee fields exposed by list_employees and get_employee_info, in output order
+_SUMMARY_FIELDS = ("employee_id", "name", "department", "title", "manager", "status")
+_FULL_FIELDS = (
+    "id", "employee_id", "name", "email", "department", "title", "manager", "hire_date",
+    "status", "location", "phone", "salary_band", "benefits", "access_level", "last_login"
+)
+_get_summary_fields = attrgetter(*_SUMMARY_FIELDS)
+_get_full_fields = attrgetter(*_FULL_FIELDS)
+
+
+@dataclass(frozen=True, slots=True)
+class Employee:
+    """Employee record (read-only)"""
+    id: str
+    employee_id: str
+    name: str
+    email: str
+    department: str
+    title: str
+    manager: Optional[str]
+    hire_date: str
+    status: str
+    location: str
+    phone: str
+    salary_band: str
+    benefits: Tuple[str, ...]
+    access_level: str
+    last_login: str
+    reports_count: int
+    team: str
+    
+    def to_summary_dict(self) -> Dict[str, Any]:
+        """Fields returned by list_employees"""
+        return dict(zip(_SUMMARY_FIELDS, _get_summary_fields(self)))
+    
+    def to_full_dict(self) -> Dict[str, Any]:
+        """Fields returned by get_employee_info"""
+        return dict(zip(_FULL_FIELDS, _get_full_fields(self)))
+
 
 class EmployeesMCP:
     """
@@ -37,84 +239,25 @@ class EmployeesMCP:
     
     def __init__(self):
         self.employees_data = self._initialize_mock_data()
-        self.tools = self._define_tools()
+        self._build_indexes()
+        self.tools = _TOOLS
+        
+        # Tool name -> handler(arguments, token_claims) used by call_tool. The
+        # tools are pure in-memory lookups, so handlers are plain functions
+        self._dispatch = {
+            "list_employees": lambda a, t: self._tool_list_employees(a.get("status_filter", "Active"), t),
+            "get_employee_info": self._dispatch_get_employee_info,
+            "get_department_info": lambda a, t: self._tool_get_department_info(a.get("department_name"), t),
+            "get_benefits_info": lambda a, t: self._tool_get_benefits_info(t),
+            "get_salary_info": lambda a, t: self._tool_get_salary_info(t),
+            "get_onboarding_info": lambda a, t: self._tool_get_onboarding_info(t),
+        }
+        
         logger.info("EmployeesMCP initialized with mock data and tools")
     
-    def _define_tools(self) -> List[Dict[str, Any]]:
-        """Define available MCP tools for employee management"""
-        return [
-            {
-                "name": "list_employees",
-                "description": "List all active employees with their basic information (department, title, manager). Requires mcp:read scope.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "status_filter": {
-                            "type": "string",
-                            "enum": ["Active", "Inactive", "All"],
-                            "description": "Filter employees by status. Default: Active",
-                            "default": "Active"
-                        }
-                    }
-                }
-            },
-            {
-                "name": "get_employee_info",
-                "description": "Get detailed information about a specific employee by name or employee ID. Requires mcp:read scope.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "employee_identifier": {
-                            "type": "string",
-                            "description": "Employee name (e.g., 'John Smith') or employee ID (e.g., 'EMP001')"
-                        }
-                    },
-                    "required": ["employee_identifier"]
-                }
-            },
-            {
-                "name": "get_department_info",
-                "description": "Get overview information about all departments including head, employee count, budget, and location.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "department_name": {
-                            "type": "string",
-                            "description": "Optional: Specific department name. If not provided, returns all departments.",
-                            "enum": ["Engineering", "Finance", "HR", "Legal", "Product", "Marketing", "Sales", None]
-                        }
-                    }
-                }
-            },
-            {
-                "name": "get_benefits_info",
-                "description": "Get information about available employee benefits and enrollment statistics.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {}
-                }
-            },
-            {
-                "name": "get_salary_info",
-                "description": "Get salary band distribution information. Requires mcp:read scope.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {}
-                }
-            },
-            {
-                "name": "get_onboarding_info",
-                "description": "Get information about the employee onboarding process and steps.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {}
-                }
-            }
-        ]
-    
     def _initialize_mock_data(self) -> Dict[str, Any]:
         """Initialize mock employee data"""
-        return {
+        data = {
             "employees": {
                 # Engineering Department
                 "emp-001": {
@@ -494,99 +637,216 @@ class EmployeesMCP:
                 }
             }
         }
+        
+        # Share one string object per repeated value (departments, locations,
+        # benefits, ...) so records stay small and comparisons hit identity
+        for record in data["employees"].values():
+            for field in _INTERNED_EMPLOYEE_FIELDS:
+                if isinstance(record[field], str):
+                    record[field] = sys.intern(record[field])
+            record["benefits"] = tuple(sys.intern(b) for b in record["benefits"])
+        for info in data["departments"].values():
+            info["name"] = sys.intern(info["name"])
+            info["location"] = sys.intern(info["location"])
+        
+        data["employees"] = {emp_id: Employee(**record) for emp_id, record in data["employees"].items()}
+        return data
+    
+    def _build_indexes(self):
+        """Build lookup indexes over the employee data (rebuild after any data change)"""
+        employees = self.employees_data["employees"].values()
+        
+        # Exact-match lookups keyed by lowercased employee ID and name
+        self._by_emp_id_lower = {e.employee_id.lower(): e for e in employees}
+        self._by_name_lower = {e.name.lower(): e for e in employees}
+        
+        # Prefix trie over lowercased full names and name tokens, so "smi" or
+        # "john" resolve without scanning. Each node keeps the first employee
+        # (in data order) whose name or token passes through it
+        self._name_trie: Dict[str, Any] = {"children": {}, "emp": None}
+        for e in employees:
+            name_lower = e.name.lower()
+            for key in [name_lower] + name_lower.split():
+                node = self._name_trie
+                for char in key:
+                    node = node["children"].setdefault(char, {"children": {}, "emp": None})
+                    if node["emp"] is None:
+                        node["emp"] = e
+        
+        # Lowercased names in data order for substring (non-prefix) matching
+        self._names_lower = [(e.name.lower(), e) for e in employees]
+        
+        # list_employees summaries bucketed by status, plus an "All" bucket,
+        # kept only as the pre-serialized result for each accepted filter so
+        # the shared lists can't be mutated through a returned reference
+        summary_by_status: Dict[str, List[Dict[str, Any]]] = {"Active": [], "Inactive": [], "All": []}
+        for e in employees:
+            summary = e.to_summary_dict()
+            summary_by_status.setdefault(e.status, []).append(summary)
+            summary_by_status["All"].append(summary)
+        self._list_employees_json: Dict[str, bytes] = {
+            status_filter: orjson.dumps({
+                "employees": summary_by_status[status_filter],
+                "total_count": len(summary_by_status[status_filter]),
+                "status_filter": status_filter
+            })
+            for status_filter in _VALID_STATUS
+        }
+        
+        # Benefits enrollment payload; the mock data is static so this is
+        # computed once rather than on every get_benefits_info call
+        self._benefit_enrollments = Counter(b for e in employees for b in e.benefits)
+        benefits_response = {
+            "benefits": [
+                {
+                    "name": benefit,
+                    "enrollment_count": self._benefit_enrollments[benefit]
+                }
+                for benefit in sorted(self._benefit_enrollments)
+            ],
+            "total_unique_benefits": len(self._benefit_enrollments),
+            "total_employees": len(employees)
+        }
+        
+        # Salary bands in first-seen order, with the names in each band
+        salary_bands: Dict[str, List[str]] = {}
+        for e in employees:
+            salary_bands.setdefault(e.salary_band, []).append(e.name)
+        salary_response = {
+            "salary_bands": {
+                band: {
+                    "employees": names,
+                    "count": len(names)
+                }
+                for band, names in salary_bands.items()
+            }
+        }
+        
+        # Department responses
+        departments = self.employees_data["departments"]
+        department_response_by_name = {
+            name: {"department": {"name": name, **info}}
+            for name, info in departments.items()
+        }
+        all_departments_response = {
+            "departments": [
+                response["department"] for response in department_response_by_name.values()
+            ],
+            "total_count": len(departments)
+        }
+        
+        # Tools whose output never depends on the caller beyond the permission
+        # check return these pre-serialized results (bytes) from call_tool, so
+        # transports splice them into responses without re-encoding and no
+        # caller can mutate shared state
+        self._cached_json = {
+            "departments_all": orjson.dumps(all_departments_response),
+            "benefits": orjson.dumps(benefits_response),
+            "salary": orjson.dumps(salary_response),
+            "onboarding": orjson.dumps(_ONBOARDING_RESPONSE)
+        }
+        self._department_json_by_name = {
+            name: orjson.dumps(response)
+            for name, response in department_response_by_name.items()
+        }
     
     def _has_permission(self, token_claims: Dict[str, Any], permission: str) -> bool:
         """Check if user has specific permission based on OAuth scope"""
         if not token_claims:
-            logger.warning(f"Permission '{permission}' denied: no token claims")
+            logger.warning("Permission '%s' denied: no token claims", permission)
             return False
         
-        scope = token_claims.get("scope", "")
-        
-        permission_scope_map = {
-            "view_employee_list": ["read_data", "mcp:read"],
-            "view_employee_details": ["read_data", "mcp:read"],
-            "view_salary_info": ["read_data", "mcp:read"],
-            "edit_employee": ["write_data", "mcp:write"],
-            "delete_employee": ["write_data", "mcp:write"]
-        }
+        required_scopes = _PERMISSION_SCOPE_MAP.get(permission)
+        if not required_scopes:
+            logger.warning("Permission '%s' denied: unknown permission", permission)
+            return False
         
-        required_scopes = permission_scope_map.get(permission, [])
+        scope = token_claims.get("scope", "")
         
-        # Handle scope as either space-separated string or array
-        if isinstance(scope, list):
-            scope_list = scope
-        elif isinstance(scope, str):
-            scope_list = scope.split() if scope else []
+        # Handle scope as either space-separated string or array. Only whole
+        # scope names count; "mcp:read" must not match "mcp:read_all"
+        if isinstance(scope, str):
+            has_permission = _scope_grants(permission, scope)
+        elif isinstance(scope, list):
+            has_permission = _scope_grants(permission, tuple(scope))
         else:
-            scope_list = []
-        
-        # Check if any required scope is in the token's scopes
-        has_permission = any(
-            req_scope in scope_list or req_scope in scope 
-            for req_scope in required_scopes
-        )
+            has_permission = False
         
         if has_permission:
-            logger.info(f"Permission '{permission}' GRANTED (scopes: {scope_list}, required: {required_scopes})")
+            logger.info("Permission '%s' GRANTED (scopes: %s, required: %s)", permission, scope, required_scopes)
         else:
-            logger.warning(f"Permission '{permission}' DENIED (scopes: {scope_list}, required: {required_scopes})")
-            logger.debug(f"Full token claims keys: {list(token_claims.keys())}")
+            logger.warning("Permission '%s' DENIED (scopes: %s, required: %s)", permission, scope, required_scopes)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Full token claims keys: %s", list(token_claims.keys()))
         
         return has_permission
     
-    def _find_employee_by_identifier(self, identifier: str) -> Optional[Dict[str, Any]]:
+    def _find_employee_by_identifier(self, identifier: str) -> Optional[Employee]:
         """Find employee by name or ID"""
-        employees = self.employees_data["employees"]
+        key = identifier.lower()
         
-        # Check by employee ID first
-        for employee in employees.values():
-            if employee['employee_id'].lower() == identifier.lower():
-                return employee
+        # Check by employee ID first, then exact name
+        employee = self._by_emp_id_lower.get(key) or self._by_name_lower.get(key)
+        if employee:
+            return employee
+        
+        # Check by name or name-token prefix
+        node = self._name_trie
+        for char in key:
+            node = node["children"].get(char)
+            if node is None:
+                break
+        else:
+            if node["emp"]:
+                return node["emp"]
         
-        # Check by name
-        for employee in employees.values():
-            if identifier.lower() in employee['name'].lower():
+        # Fall back to substring match anywhere in the name
+        for name_lower, employee in self._names_lower:
+            if key in name_lower:
                 return employee
         
         return None
     
-    def list_tools(self) -> List[Dict[str, Any]]:
-        """List all available MCP tools"""
+    def list_tools(self) -> Tuple[Mapping[str, Any], ...]:
+        """
+        List all available MCP tools.
+        
+        Items are read-only mappings shared by every caller; encode them with
+        json_default (plain json.dumps rejects them).
+        """
         return self.tools
     
-    async def call_tool(self, tool_name: str, arguments: Dict[str, Any], token_claims: Dict[str, Any]) -> Dict[str, Any]:
+    async def call_tool(
+        self, tool_name: str, arguments: Dict[str, Any], token_claims: Dict[str, Any]
+    ) -> Union[Dict[str, Any], bytes]:
         """
         Call an MCP tool by name with arguments.
         
         Token validation must be done by the HTTP handler before calling this.
         Token claims are passed for permission checking.
+        
+        Returns the result dict, or for static results the already-serialized
+        JSON bytes, which transports embed as-is.
         """
         try:
-            if tool_name == "list_employees":
-                status_filter = arguments.get("status_filter", "Active")
-                return await self._tool_list_employees(status_filter, token_claims)
-            elif tool_name == "get_employee_info":
-                employee_identifier = arguments.get("employee_identifier")
-                if not employee_identifier:
-                    return {"error": "employee_identifier is required"}
-                return await self._tool_get_employee_info(employee_identifier, token_claims)
-            elif tool_name == "get_department_info":
-                department_name = arguments.get("department_name")
-                return await self._tool_get_department_info(department_name, token_claims)
-            elif tool_name == "get_benefits_info":
-                return await self._tool_get_benefits_info(token_claims)
-            elif tool_name == "get_salary_info":
-                return await self._tool_get_salary_info(token_claims)
-            elif tool_name == "get_onboarding_info":
-                return await self._tool_get_onboarding_info(token_claims)
-            else:
+            handler = self._dispatch.get(tool_name)
+            if handler is None:
                 return {"error": f"Unknown tool: {tool_name}"}
+            if not isinstance(arguments, dict):
+                return {"error": "Tool arguments must be an object"}
+            return handler(arguments, token_claims)
         except Exception as e:
-            logger.error(f"Error calling tool {tool_name}: {e}")
+            logger.error("Error calling tool %s: %s", tool_name, e)
             return {"error": str(e)}
     
-    async def _tool_list_employees(self, status_filter: str, token_claims: Dict[str, Any]) -> Dict[str, Any]:
+    def _dispatch_get_employee_info(self, arguments: Dict[str, Any], token_claims: Dict[str, Any]) -> Dict[str, Any]:
+        """Extract arguments for get_employee_info, rejecting a missing identifier"""
+        employee_identifier = arguments.get("employee_identifier")
+        if not employee_identifier:
+            return {"error": "employee_identifier is required"}
+        return self._tool_get_employee_info(employee_identifier, token_claims)
+    
+    def _tool_list_employees(self, status_filter: str, token_claims: Dict[str, Any]) -> Union[Dict[str, Any], bytes]:
         """Tool implementation for list_employees"""
         if not self._has_permission(token_claims, "view_employee_list"):
             return {
@@ -594,27 +854,16 @@ class EmployeesMCP:
                 "message": "You don't have permission to view the employee list. Please contact HR for access."
             }
         
-        employees = self.employees_data["employees"]
-        filtered_employees = []
-        
-        for emp_id, employee in employees.items():
-            if status_filter == "All" or employee['status'] == status_filter:
-                filtered_employees.append({
-                    "employee_id": employee['employee_id'],
-                    "name": employee['name'],
-                    "department": employee['department'],
-                    "title": employee['title'],
-                    "manager": employee['manager'],
-                    "status": employee['status']
-                })
+        if not isinstance(status_filter, str) or status_filter not in _VALID_STATUS:
+            return {
+                "error": "invalid_status_filter",
+                "message": f"Invalid status_filter '{status_filter}'. Use one of: Active, Inactive, All.",
+                "allowed": sorted(_VALID_STATUS)
+            }
         
-        return {
-            "employees": filtered_employees,
-            "total_count": len(filtered_employees),
-            "status_filter": status_filter
-        }
+        return self._list_employees_json[status_filter]
     
-    async def _tool_get_employee_info(self, employee_identifier: str, token_claims: Dict[str, Any]) -> Dict[str, Any]:
+    def _tool_get_employee_info(self, employee_identifier: str, token_claims: Dict[str, Any]) -> Dict[str, Any]:
         """Tool implementation for get_employee_info"""
         if not self._has_permission(token_claims, "view_employee_details"):
             return {
@@ -629,79 +878,27 @@ class EmployeesMCP:
                 "message": f"Employee '{employee_identifier}' not found."
             }
         
-        return {
-            "employee": {
-                "id": employee['id'],
-                "employee_id": employee['employee_id'],
-                "name": employee['name'],
-                "email": employee['email'],
-                "department": employee['department'],
-                "title": employee['title'],
-                "manager": employee['manager'],
-                "hire_date": employee['hire_date'],
-                "status": employee['status'],
-                "location": employee['location'],
-                "phone": employee['phone'],
-                "salary_band": employee['salary_band'],
-                "benefits": employee['benefits'],
-                "access_level": employee['access_level'],
-                "last_login": employee['last_login']
-            }
-        }
+        return {"employee": employee.to_full_dict()}
     
-    async def _tool_get_department_info(self, department_name: Optional[str], token_claims: Dict[str, Any]) -> Dict[str, Any]:
+    def _tool_get_department_info(
+        self, department_name: Optional[str], token_claims: Dict[str, Any]
+    ) -> Union[Dict[str, Any], bytes]:
         """Tool implementation for get_department_info"""
-        departments = self.employees_data["departments"]
-        
         if department_name:
-            if department_name in departments:
-                return {
-                    "department": {
-                        "name": department_name,
-                        **departments[department_name]
-                    }
-                }
-            else:
-                return {
-                    "error": "department_not_found",
-                    "message": f"Department '{department_name}' not found."
-                }
-        else:
+            response = self._department_json_by_name.get(department_name)
+            if response is not None:
+                return response
             return {
-                "departments": [
-                    {"name": name, **info} 
-                    for name, info in departments.items()
-                ],
-                "total_count": len(departments)
+                "error": "department_not_found",
+                "message": f"Department '{department_name}' not found."
             }
+        return self._cached_json["departments_all"]
     
-    async def _tool_get_benefits_info(self, token_claims: Dict[str, Any]) -> Dict[str, Any]:
+    def _tool_get_benefits_info(self, token_claims: Dict[str, Any]) -> bytes:
         """Tool implementation for get_benefits_info"""
-        employees = self.employees_data["employees"]
-        
-        all_benefits = set()
-        benefit_enrollments = {}
-        
-        for employee in employees.values():
-            for benefit in employee['benefits']:
-                all_benefits.add(benefit)
-                if benefit not in benefit_enrollments:
-                    benefit_enrollments[benefit] = 0
-                benefit_enrollments[benefit] += 1
-        
-        return {
-            "benefits": [
-                {
-                    "name": benefit,
-                    "enrollment_count": benefit_enrollments[benefit]
-                }
-                for benefit in sorted(all_benefits)
-            ],
-            "total_unique_benefits": len(all_benefits),
-            "total_employees": len(employees)
-        }
+        return self._cached_json["benefits"]
     
-    async def _tool_get_salary_info(self, token_claims: Dict[str, Any]) -> Dict[str, Any]:
+    def _tool_get_salary_info(self, token_claims: Dict[str, Any]) -> Union[Dict[str, Any], bytes]:
         """Tool implementation for get_salary_info"""
         if not self._has_permission(token_claims, "view_salary_info"):
             return {
@@ -709,57 +906,23 @@ class EmployeesMCP:
                 "message": "You don't have permission to view salary information. Please contact HR for access."
             }
         
-        employees = self.employees_data["employees"]
-        salary_bands = {}
-        
-        for employee in employees.values():
-            band = employee['salary_band']
-            if band not in salary_bands:
-                salary_bands[band] = []
-            salary_bands[band].append(employee['name'])
-        
-        return {
-            "salary_bands": {
-                band: {
-                    "employees": names,
-                    "count": len(names)
-                }
-                for band, names in salary_bands.items()
-            }
-        }
+        return self._cached_json["salary"]
     
-    async def _tool_get_onboarding_info(self, token_claims: Dict[str, Any]) -> Dict[str, Any]:
+    def _tool_get_onboarding_info(self, token_claims: Dict[str, Any]) -> bytes:
         """Tool implementation for get_onboarding_info"""
-        return {
-            "onboarding_process": {
-                "pre_boarding": {
-                    "timeline": "1 week before start date",
-                    "steps": [
-                        "Send welcome email with company information",
-                        "Set up IT accounts and access",
-                        "Schedule orientation session"
-                    ]
-                },
-                "first_day": {
-                    "steps": [
-                        "Complete HR paperwork",
-                        "IT setup and equipment assignment",
-                        "Department introduction"
-                    ]
-                },
-                "first_week": {
-                    "steps": [
-                        "Training sessions",
-                        "Buddy assignment",
-                        "Goal setting meeting"
-                    ]
-                },
-                "first_month": {
-                    "steps": [
-                        "Regular check-ins",
-                        "Performance review setup",
-                        "Benefits enrollment"
-                    ]
-                }
-            }
-        }
+        return self._cached_json["onboarding"]
+
+
+# Global EmployeesMCP instance (shared by the HTTP and stdio transports)
+_employees_mcp: Optional[EmployeesMCP] = None
+_employees_mcp_lock = threading.Lock()
+
+
+def get_employees_mcp() -> EmployeesMCP:
+    """Get or create global EmployeesMCP instance (thread-safe)"""
+    global _employees_mcp
+    if _employees_mcp is None:
+        with _employees_mcp_lock:
+            if _employees_mcp is None:
+                _employees_mcp = EmployeesMCP()
+    return _employees_mcp
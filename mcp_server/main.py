@@ -13,24 +13,27 @@ Environment:
     PORT - Server port (default: 8001)
 """
 
+import asyncio
 import logging
 import os
 import sys
 from contextlib import asynccontextmanager
-from typing import Optional
+from typing import Any, Dict, Optional
 
-from fastapi import FastAPI, HTTPException, Header, Request
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import Depends, FastAPI, HTTPException, Header, Request
+from fastapi.responses import ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
-from mcp_server.employees_mcp import EmployeesMCP
+from mcp_server.employees_mcp import get_employees_mcp, json_default
 from mcp_server.auth.okta_validator import validate_authorization_header, get_validator
 from mcp_server.mcp_protocol import (
     MCPProtocolHandler,
     MCPSessionManager,
     MCP_PROTOCOL_VERSION,
+    jsonrpc_result,
     session_manager,
 )
 
@@ -61,7 +64,11 @@ logger.info("Note: Audience and other config auto-discovered from OAuth 2.0 endp
 logger.info("=" * 80)
 
 # Initialize MCP server globally
-employees_mcp = EmployeesMCP()
+employees_mcp = get_employees_mcp()
+
+# The tool list is static, so it is serialized once for /tools and tools/list
+tools_json = orjson.dumps(employees_mcp.list_tools(), default=json_default)
+tools_list_json = b'{"tools":' + tools_json + b"}"
 
 
 @asynccontextmanager
@@ -69,10 +76,21 @@ async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown"""
     # Startup
     logger.info("MCP server startup completed")
+    jwks_refresher = None
     try:
         # Test Okta token validator initialization
         validator = get_validator()
         logger.info(f"Okta token validator initialized: {validator.__class__.__name__}")
+        
+        # Prefetch discovery metadata and JWKS so the first request hits warm caches
+        if await validator.warm():
+            logger.info("Okta discovery metadata and JWKS prefetched")
+        else:
+            logger.warning("Failed to prefetch Okta JWKS, will retry on first request")
+        
+        # Keep the JWKS revalidated in the background so key rotation is
+        # picked up without a request ever waiting on Okta
+        jwks_refresher = asyncio.create_task(validator.run_jwks_refresher(interval=300))
     except Exception as e:
         logger.error(f"Failed to initialize Okta token validator: {e}")
         logger.warning("Server will reject all requests until Okta is properly configured")
@@ -81,6 +99,12 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("MCP server shutting down")
+    if jwks_refresher is not None:
+        jwks_refresher.cancel()
+    try:
+        await get_validator().aclose()
+    except Exception as e:
+        logger.warning(f"Failed to close Okta token validator: {e}")
 
 
 # Create FastAPI app
@@ -88,16 +112,21 @@ app = FastAPI(
     title="Okta Sample Employee MCP Server",
     description="Standalone HTTP MCP server for employee data with Okta token validation",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# Add CORS middleware
+# Add CORS middleware. Origins come from CORS_ORIGINS (comma-separated,
+# default "*"); methods and headers are fixed to what the MCP routes use
+cors_origins = [
+    origin.strip() for origin in os.getenv("CORS_ORIGINS", "*").split(",") if origin.strip()
+]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure for production
+    allow_origins=cors_origins,  # Configure for production
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "DELETE"],
+    allow_headers=["authorization", "content-type", "mcp-session-id", "mcp-protocol-version"],
 )
 
 
@@ -114,6 +143,22 @@ class ToolCallResponse(BaseModel):
     token_info: Optional[dict] = None
 
 
+# Dependencies
+
+async def require_token_claims(authorization: Optional[str] = Header(None)) -> Dict[str, Any]:
+    """
+    Validated Okta token claims for the request, or 401.
+    
+    Resolved once per request; repeat tokens are served from the
+    validator's expiry-aware cache, so no signature check is repeated.
+    """
+    token_claims = await validate_authorization_header(authorization)
+    if not token_claims:
+        logger.warning("Invalid or missing token")
+        raise HTTPException(status_code=401, detail="Invalid or missing token")
+    return token_claims
+
+
 # Routes
 
 @app.get("/health")
@@ -127,34 +172,80 @@ async def health_check():
 
 
 @app.get("/tools")
-async def list_tools(authorization: Optional[str] = Header(None)):
+async def list_tools(token_claims: Dict[str, Any] = Depends(require_token_claims)):
     """
     List available MCP tools.
     
     Requires valid Okta token in Authorization header.
     """
-    # Validate token
-    token_claims = await validate_authorization_header(authorization)
-    if not token_claims:
-        raise HTTPException(status_code=401, detail="Invalid or missing token")
-    
-    tools = employees_mcp.list_tools()
+    token_info = {
+        "sub": token_claims.get("sub"),
+        "scope": token_claims.get("scope"),
+        "exp": token_claims.get("exp")
+    }
     
-    return {
-        "tools": tools,
-        "count": len(tools),
-        "token_info": {
+    # Splice the pre-serialized (read-only) tool list into the response
+    return Response(
+        content=b'{"tools":' + tools_json
+        + b',"count":' + str(len(employees_mcp.list_tools())).encode()
+        + b',"token_info":' + orjson.dumps(token_info) + b"}",
+        media_type="application/json",
+    )
+
+
+async def _call_tool_impl(
+    tool_name: str,
+    arguments: dict,
+    token_claims: Dict[str, Any]
+) -> Response:
+    """Run a tool for validated claims; shared by /call_tool and /tools/{tool_name}"""
+    try:
+        # STEP 1: Token already validated by the require_token_claims dependency
+        logger.info("Tool call request: %s", tool_name)
+        logger.info("Token validated for user: %s", token_claims.get('sub'))
+        logger.debug("Token scope: %s", token_claims.get('scope'))
+        
+        # STEP 2: Call the tool with validated claims
+        logger.info("Calling tool: %s with args: %s", tool_name, arguments)
+        
+        token_info = {
             "sub": token_claims.get("sub"),
             "scope": token_claims.get("scope"),
-            "exp": token_claims.get("exp")
+            "exp": token_claims.get("exp"),
+            "aud": token_claims.get("aud")
         }
-    }
+        
+        result = await employees_mcp.call_tool(
+            tool_name=tool_name,
+            arguments=arguments,
+            token_claims=token_claims
+        )
+        
+        # STEP 3: Return result with token info
+        logger.info("Tool executed successfully: %s", tool_name)
+        
+        # Static tools return a pre-serialized result; splice it in as-is
+        if isinstance(result, bytes):
+            return Response(
+                content=b'{"result":' + result + b',"token_info":' + orjson.dumps(token_info) + b"}",
+                media_type="application/json",
+            )
+        
+        # Server-built payload: encode directly rather than re-validating it
+        # against the ToolCallResponse model (still used for the API schema)
+        return ORJSONResponse(content={"result": result, "token_info": token_info})
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error calling tool %s: %s", tool_name, e, exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Error calling tool: {str(e)}")
 
 
 @app.post("/call_tool")
 async def call_tool(
     request: ToolCallRequest,
-    authorization: Optional[str] = Header(None)
+    token_claims: Dict[str, Any] = Depends(require_token_claims)
 ) -> ToolCallResponse:
     """
     Call an MCP tool.
@@ -190,52 +281,14 @@ async def call_tool(
     }
     ```
     """
-    try:
-        # STEP 1: Validate Okta token
-        logger.info(f"Tool call request: {request.tool_name}")
-        
-        token_claims = await validate_authorization_header(authorization)
-        if not token_claims:
-            logger.warning(f"Invalid token for tool: {request.tool_name}")
-            raise HTTPException(status_code=401, detail="Invalid or missing token")
-        
-        logger.info(f"Token validated for user: {token_claims.get('sub')}")
-        logger.debug(f"Token scope: {token_claims.get('scope')}")
-        
-        # STEP 2: Call the tool with validated claims
-        logger.info(f"Calling tool: {request.tool_name} with args: {request.arguments}")
-        
-        result = await employees_mcp.call_tool(
-            tool_name=request.tool_name,
-            arguments=request.arguments,
-            token_claims=token_claims
-        )
-        
-        # STEP 3: Return result with token info
-        logger.info(f"Tool executed successfully: {request.tool_name}")
-        
-        return ToolCallResponse(
-            result=result,
-            token_info={
-                "sub": token_claims.get("sub"),
-                "scope": token_claims.get("scope"),
-                "exp": token_claims.get("exp"),
-                "aud": token_claims.get("aud")
-            }
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error calling tool {request.tool_name}: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"Error calling tool: {str(e)}")
+    return await _call_tool_impl(request.tool_name, request.arguments, token_claims)
 
 
 @app.post("/tools/{tool_name}")
 async def call_tool_by_name(
     tool_name: str,
     arguments: dict = {},
-    authorization: Optional[str] = Header(None)
+    token_claims: Dict[str, Any] = Depends(require_token_claims)
 ) -> ToolCallResponse:
     """
     Call a specific MCP tool by name (alternative endpoint).
@@ -252,11 +305,7 @@ async def call_tool_by_name(
     }
     ```
     """
-    # Use the main call_tool handler
-    return await call_tool(
-        ToolCallRequest(tool_name=tool_name, arguments=arguments),
-        authorization=authorization
-    )
+    return await _call_tool_impl(tool_name, arguments, token_claims)
 
 
 @app.post("/mcp")
@@ -275,8 +324,8 @@ async def mcp_streamable_http_post(
     try:
         # Validate protocol version
         if mcp_protocol_version and mcp_protocol_version != MCP_PROTOCOL_VERSION:
-            logger.warning(f"Unsupported protocol version: {mcp_protocol_version}")
-            return JSONResponse(
+            logger.warning("Unsupported protocol version: %s", mcp_protocol_version)
+            return ORJSONResponse(
                 status_code=400,
                 content=MCPProtocolHandler.error_response(
                     -32700,
@@ -286,10 +335,10 @@ async def mcp_streamable_http_post(
 
         # Parse JSON-RPC request
         try:
-            body = await request.json()
+            body = orjson.loads(await request.body())
         except Exception as e:
-            logger.error(f"Invalid JSON in MCP request: {e}")
-            return JSONResponse(
+            logger.error("Invalid JSON in MCP request: %s", e)
+            return ORJSONResponse(
                 status_code=400,
                 content=MCPProtocolHandler.error_response(
                     -32700, "Invalid JSON-RPC request"
@@ -301,7 +350,7 @@ async def mcp_streamable_http_post(
             token_claims = await validate_authorization_header(authorization)
             if not token_claims:
                 logger.warning("Invalid token for MCP request")
-                return JSONResponse(
+                return ORJSONResponse(
                     status_code=401,
                     content=MCPProtocolHandler.error_response(
                         -32001, "Unauthorized"
@@ -313,8 +362,8 @@ async def mcp_streamable_http_post(
         # Handle session management
         if mcp_session_id:
             if not session_manager.validate_session(mcp_session_id):
-                logger.warning(f"Invalid session: {mcp_session_id}")
-                return JSONResponse(status_code=404, content={})
+                logger.warning("Invalid session: %s", mcp_session_id)
+                return ORJSONResponse(status_code=404, content={})
             session_manager.update_session(mcp_session_id)
         elif body.get("method") == "initialize":
             # Create new session for initialize
@@ -336,10 +385,9 @@ async def mcp_streamable_http_post(
                     "version": "1.0.0",
                 },
             }
-            response = MCPProtocolHandler.create_response(result, request_id)
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=200,
-                content=response.to_dict(),
+                content=jsonrpc_result(result, request_id),
                 headers={"Mcp-Session-Id": mcp_session_id} if mcp_session_id else {},
             )
 
@@ -350,8 +398,8 @@ async def mcp_streamable_http_post(
                     body
                 )
             except ValueError as e:
-                logger.error(f"Invalid tool call: {e}")
-                return JSONResponse(
+                logger.error("Invalid tool call: %s", e)
+                return ORJSONResponse(
                     status_code=400,
                     content=MCPProtocolHandler.error_response(-32602, str(e), request_id),
                 )
@@ -361,15 +409,21 @@ async def mcp_streamable_http_post(
                 result = await employees_mcp.call_tool(
                     tool_name, arguments, token_claims
                 )
-                response = MCPProtocolHandler.create_response(result, request_id)
-                return JSONResponse(
+                # Static tools return a pre-serialized result; splice it in as-is
+                if isinstance(result, bytes):
+                    return Response(
+                        content=MCPProtocolHandler.create_raw_response(result, request_id),
+                        media_type="application/json",
+                        headers={"Mcp-Session-Id": mcp_session_id} if mcp_session_id else {},
+                    )
+                return ORJSONResponse(
                     status_code=200,
-                    content=response.to_dict(),
+                    content=jsonrpc_result(result, request_id),
                     headers={"Mcp-Session-Id": mcp_session_id} if mcp_session_id else {},
                 )
             except Exception as e:
-                logger.error(f"Error executing tool {tool_name}: {e}")
-                return JSONResponse(
+                logger.error("Error executing tool %s: %s", tool_name, e)
+                return ORJSONResponse(
                     status_code=200,
                     content=MCPProtocolHandler.error_response(
                         -32603, str(e), request_id
@@ -381,18 +435,15 @@ async def mcp_streamable_http_post(
 
         elif method == "tools/list":
             # List tools request
-            tools = employees_mcp.list_tools()
-            result = {"tools": tools}
-            response = MCPProtocolHandler.create_response(result, request_id)
-            return JSONResponse(
-                status_code=200,
-                content=response.to_dict(),
+            return Response(
+                content=MCPProtocolHandler.create_raw_response(tools_list_json, request_id),
+                media_type="application/json",
                 headers={"Mcp-Session-Id": mcp_session_id} if mcp_session_id else {},
             )
 
         else:
-            logger.warning(f"Unknown JSON-RPC method: {method}")
-            return JSONResponse(
+            logger.warning("Unknown JSON-RPC method: %s", method)
+            return ORJSONResponse(
                 status_code=200,
                 content=MCPProtocolHandler.error_response(
                     -32601, f"Unknown method: {method}", request_id
@@ -401,8 +452,8 @@ async def mcp_streamable_http_post(
             )
 
     except Exception as e:
-        logger.error(f"Unhandled error in MCP POST: {e}", exc_info=True)
-        return JSONResponse(
+        logger.error("Unhandled error in MCP POST: %s", e, exc_info=True)
+        return ORJSONResponse(
             status_code=500,
             content=MCPProtocolHandler.error_response(
                 -32603, "Internal server error"
@@ -424,7 +475,7 @@ async def mcp_streamable_http_get(
     try:
         # For now, return 405 Method Not Allowed
         # SSE streaming can be implemented if server-to-client notifications are needed
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=405,
             content={
                 "error": "SSE streaming not currently supported",
@@ -432,8 +483,8 @@ async def mcp_streamable_http_get(
             },
         )
     except Exception as e:
-        logger.error(f"Error in MCP GET: {e}", exc_info=True)
-        return JSONResponse(status_code=500, content={"error": "Internal server error"})
+        logger.error("Error in MCP GET: %s", e, exc_info=True)
+        return ORJSONResponse(status_code=500, content={"error": "Internal server error"})
 
 
 @app.delete("/mcp")
@@ -449,16 +500,16 @@ async def mcp_streamable_http_delete(
     try:
         if mcp_session_id:
             session_manager.terminate_session(mcp_session_id)
-            logger.info(f"Session terminated: {mcp_session_id}")
-            return JSONResponse(status_code=200, content={"status": "terminated"})
+            logger.info("Session terminated: %s", mcp_session_id)
+            return ORJSONResponse(status_code=200, content={"status": "terminated"})
         else:
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=400,
                 content={"error": "Mcp-Session-Id header required"},
             )
     except Exception as e:
-        logger.error(f"Error in MCP DELETE: {e}", exc_info=True)
-        return JSONResponse(status_code=500, content={"error": "Internal server error"})
+        logger.error("Error in MCP DELETE: %s", e, exc_info=True)
+        return ORJSONResponse(status_code=500, content={"error": "Internal server error"})
 
 
 # Error handlers
@@ -466,7 +517,7 @@ async def mcp_streamable_http_delete(
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions"""
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.detail,
@@ -479,8 +530,8 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle unexpected exceptions"""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -506,10 +557,14 @@ if __name__ == "__main__":
     port = int(os.getenv("PORT", 8001))
     environment = os.getenv("ENVIRONMENT", "development")
     
+    # uvicorn[standard] provides uvloop and httptools, which uvicorn picks
+    # automatically. Workers default to WEB_CONCURRENCY (1); sessions and
+    # caches are per process, so MCP clients need sticky routing when > 1
     uvicorn.run(
-        app,
+        "mcp_server.main:app",
         host="0.0.0.0",
         port=port,
         reload=(environment == "development"),
+        workers=None if environment == "development" else int(os.getenv("WEB_CONCURRENCY", "1")),
         log_level=log_level.lower()
     )
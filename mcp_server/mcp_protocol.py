@@ -7,10 +7,12 @@ https://modelcontextprotocol.io/specification/2025-06-18/basic/transports
 
 import json
 import logging
+import os
+from collections import OrderedDict
 from typing import Dict, Any, Optional, AsyncGenerator
 from dataclasses import dataclass, asdict
+import time
 import uuid
-from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +71,38 @@ class JsonRpcNotification:
         return data
 
 
+# Serve-path builders: plain dicts with only the populated keys, matching
+# the dataclass to_dict() output without allocating the dataclass first
+
+def jsonrpc_result(result: Dict[str, Any], request_id: Optional[str]) -> Dict[str, Any]:
+    """Build a JSON-RPC success response dict"""
+    data = {"jsonrpc": "2.0"}
+    if result is not None:
+        data["result"] = result
+    if request_id is not None:
+        data["id"] = request_id
+    return data
+
+
+def jsonrpc_notification(method: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+    """Build a JSON-RPC notification dict"""
+    data = {"jsonrpc": "2.0", "method": method}
+    if params:
+        data["params"] = params
+    return data
+
+
+def jsonrpc_error(
+    error_code: int, error_message: str, request_id: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build a JSON-RPC error response dict"""
+    return {
+        "jsonrpc": "2.0",
+        "error": {"code": error_code, "message": error_message},
+        "id": request_id,
+    }
+
+
 class MCPProtocolHandler:
     """
     Handles MCP JSON-RPC protocol conversion.
@@ -98,11 +132,20 @@ class MCPProtocolHandler:
         )
 
     @staticmethod
-    def create_notification(
-        method: str, params: Dict[str, Any] = None
-    ) -> JsonRpcNotification:
-        """Create JSON-RPC notification"""
-        return JsonRpcNotification(method=method, params=params)
+    def create_raw_response(result_json: bytes, request_id: Optional[str]) -> bytes:
+        """Wrap an already-serialized JSON result in a JSON-RPC response"""
+        body = b'{"jsonrpc":"2.0","result":' + result_json
+        if request_id is not None:
+            body += b',"id":' + json.dumps(request_id).encode()
+        return body + b"}"
+
+    @staticmethod
+    def create_raw_error_response(error_json: bytes, request_id: Optional[str]) -> bytes:
+        """Wrap an already-serialized JSON-RPC error object in an error response"""
+        return (
+            b'{"jsonrpc":"2.0","error":' + error_json
+            + b',"id":' + json.dumps(request_id).encode() + b"}"
+        )
 
     @staticmethod
     def tool_call_to_jsonrpc(
@@ -129,48 +172,67 @@ class MCPProtocolHandler:
             request_data.get("id"),
         )
 
-    @staticmethod
-    def error_response(
-        error_code: int, error_message: str, request_id: Optional[str] = None
-    ) -> Dict[str, Any]:
-        """Create JSON-RPC error response"""
-        return {
-            "jsonrpc": "2.0",
-            "error": {"code": error_code, "message": error_message},
-            "id": request_id,
-        }
+    # Create JSON-RPC notification (plain dict, no id)
+    create_notification = staticmethod(jsonrpc_notification)
+
+    # Create JSON-RPC error response
+    error_response = staticmethod(jsonrpc_error)
 
 
 class MCPSessionManager:
     """Manage MCP sessions with session IDs"""
 
     def __init__(self):
-        self.sessions: Dict[str, Dict[str, Any]] = {}
+        # Sessions ordered by last activity (oldest first), so expired and
+        # over-capacity entries are always at the front. created_at is an
+        # epoch float (time.time()) for display; last_activity is a
+        # time.monotonic() value; sessions idle past the TTL are dropped
+        self.sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self.session_ttl = float(os.getenv("MCP_SESSION_TTL", "3600"))
+        self.max_sessions = 100_000
+
+    def _evict_stale(self, now: float):
+        """Drop expired sessions and trim to capacity, oldest first"""
+        sessions = self.sessions
+        while sessions:
+            session_id, session = next(iter(sessions.items()))
+            if len(sessions) <= self.max_sessions and now - session["last_activity"] < self.session_ttl:
+                break
+            del sessions[session_id]
+            logger.debug("Evicted session: %s", session_id)
 
     def create_session(self) -> str:
         """Create a new session, return session ID"""
         session_id = str(uuid.uuid4())
+        now = time.monotonic()
         self.sessions[session_id] = {
-            "created_at": datetime.utcnow().isoformat(),
-            "last_activity": datetime.utcnow().isoformat(),
+            "created_at": time.time(),
+            "last_activity": now,
         }
+        self._evict_stale(now)
         logger.info(f"Created session: {session_id}")
         return session_id
 
     def validate_session(self, session_id: str) -> bool:
-        """Check if session exists"""
-        return session_id in self.sessions
+        """Check if session exists and has not expired"""
+        return self.get_session(session_id) is not None
 
     def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """Get session data"""
-        return self.sessions.get(session_id)
+        """Get session data, or None if missing or expired"""
+        session = self.sessions.get(session_id)
+        if session is None:
+            return None
+        if time.monotonic() - session["last_activity"] >= self.session_ttl:
+            del self.sessions[session_id]
+            return None
+        return session
 
     def update_session(self, session_id: str):
         """Update session last activity time"""
-        if session_id in self.sessions:
-            self.sessions[session_id]["last_activity"] = (
-                datetime.utcnow().isoformat()
-            )
+        session = self.sessions.get(session_id)
+        if session is not None:
+            session["last_activity"] = time.monotonic()
+            self.sessions.move_to_end(session_id)
 
     def terminate_session(self, session_id: str):
         """Terminate a session"""
@@ -10,27 +10,30 @@ Usage:
 Environment:
     OKTA_DOMAIN - Okta tenant domain
     OKTA_AUTHORIZATION_SERVER_ID - Authorization server ID
+    MCP_SKIP_DOTENV - Set to 1 to skip loading .env at startup
 """
 
 import asyncio
-import json
 import logging
 import sys
 import os
-from typing import Dict, Any, Optional
+import stat
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Set, Tuple, Union
+
+import orjson
 
 from dotenv import load_dotenv
 
-from mcp_server.employees_mcp import EmployeesMCP
-from mcp_server.auth.okta_validator import OktaTokenValidator
+from mcp_server.employees_mcp import get_employees_mcp, json_default
+from mcp_server.auth.okta_validator import get_validator
 from mcp_server.mcp_protocol import (
     MCPProtocolHandler,
     MCP_PROTOCOL_VERSION,
+    jsonrpc_result,
 )
 
-# Load environment variables
-load_dotenv()
-
 # Configure logging to stderr (stdout is reserved for MCP messages)
 logging.basicConfig(
     level=logging.INFO,
@@ -39,49 +42,139 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Largest JSON-RPC message line accepted on stdin
+MAX_LINE_BYTES = 1 << 20
 
-class MCPStdioServer:
-    """MCP stdio transport server"""
+# Requests handled concurrently before the reader stops pulling new lines
+MAX_IN_FLIGHT = 32
 
-    def __init__(self):
-        self.employees_mcp = EmployeesMCP()
-        self.validator = OktaTokenValidator()
-        self.initialized = False
-        logger.info("MCP stdio server initialized")
+# For stdio, we don't have token claims (no HTTP headers), so every call runs
+# with the same read-only claims
+STDIO_TOKEN_CLAIMS = MappingProxyType({
+    "scope": "mcp:read mcp:write",  # Default full scope for stdio
+    "sub": "stdio-client",
+})
 
-    async def handle_request(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle JSON-RPC request"""
-        method = request_data.get("method")
-        request_id = request_data.get("id")
 
-        try:
-            if method == "initialize":
-                return await self.handle_initialize(request_data)
+# Fixed-message errors, pre-serialized. Parse and internal errors never carry
+# an id, so those are complete response lines; "Not initialized" gets the
+# request id spliced in with create_raw_error_response.
+_NOT_INITIALIZED_ERROR = orjson.dumps({"code": -32002, "message": "Not initialized"})
+_PARSE_ERROR_RESPONSE = orjson.dumps(MCPProtocolHandler.error_response(-32700, "Parse error"))
+_INTERNAL_ERROR_RESPONSE = orjson.dumps(
+    MCPProtocolHandler.error_response(-32603, "Internal server error")
+)
 
-            elif method == "tools/list":
-                return await self.handle_list_tools(request_data)
 
-            elif method == "tools/call":
-                return await self.handle_tool_call(request_data)
+class _InvalidRequest(Exception):
+    """Parsed JSON is not a usable JSON-RPC request envelope"""
+
+    def __init__(self, message: str, request_id: Any = None):
+        super().__init__(message)
+        self.request_id = request_id
+
+
+def _fast_envelope(data: Any) -> Tuple[str, Any, Any]:
+    """
+    Pull (method, id, params) out of a parsed JSON-RPC request in one pass.
+    
+    Only the envelope shape is checked here: the message must be an object
+    with a string method. Anything else raises _InvalidRequest.
+    """
+    if type(data) is not dict:
+        raise _InvalidRequest("Request must be a JSON object")
+    method = data.get("method")
+    request_id = data.get("id")
+    if type(method) is not str:
+        raise _InvalidRequest("Request method must be a string", request_id)
+    return method, request_id, data.get("params")
+
+
+class _BlockingStdoutWriter:
+    """Fallback writer used when stdout is not a pipe (e.g. redirected to a file)"""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, data: bytes):
+        self._stream.write(data)
+
+    def writelines(self, data):
+        self._stream.writelines(data)
+
+    async def drain(self):
+        self._stream.flush()
+
+
+async def _open_stdio() -> Tuple[asyncio.StreamReader, Any]:
+    """
+    Wrap stdin/stdout in asyncio streams so reads and writes never block the loop.
+    
+    Falls back to a reader thread (stdin) and blocking writes (stdout) when the
+    streams are regular files, which the pipe transports do not support.
+    """
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=MAX_LINE_BYTES)
+
+    try:
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    except (ValueError, OSError, NotImplementedError):
+        def pump():
+            for line in iter(sys.stdin.buffer.readline, b""):
+                loop.call_soon_threadsafe(reader.feed_data, line)
+            loop.call_soon_threadsafe(reader.feed_eof)
+
+        threading.Thread(target=pump, name="stdin-reader", daemon=True).start()
+
+    try:
+        transport, protocol = await loop.connect_write_pipe(
+            asyncio.streams.FlowControlMixin, sys.stdout
+        )
+        writer = asyncio.StreamWriter(transport, protocol, None, loop)
+    except (ValueError, OSError, NotImplementedError):
+        writer = _BlockingStdoutWriter(sys.stdout.buffer)
+
+    return reader, writer
+
+
+async def _read_line(reader: asyncio.StreamReader) -> Optional[bytes]:
+    """
+    Read one newline-terminated message line.
+    
+    Returns b"" at EOF, or None when the line exceeded MAX_LINE_BYTES, in
+    which case the whole line is discarded so its tail isn't parsed as a
+    separate message.
+    """
+    try:
+        return await reader.readuntil(b"\n")
+    except asyncio.IncompleteReadError as e:
+        # Last line without a trailing newline (b"" at a clean EOF)
+        return e.partial
+    except asyncio.LimitOverrunError as e:
+        discard = e.consumed
+
+    while True:
+        await reader.readexactly(discard)
+        try:
+            await reader.readuntil(b"\n")
+            return None
+        except asyncio.LimitOverrunError as e:
+            discard = e.consumed
+        except asyncio.IncompleteReadError:
+            return None
 
-            else:
-                logger.warning(f"Unknown method: {method}")
-                return MCPProtocolHandler.error_response(
-                    -32601, f"Unknown method: {method}", request_id
-                )
 
-        except Exception as e:
-            logger.error(f"Error handling {method}: {e}", exc_info=True)
-            return MCPProtocolHandler.error_response(
-                -32603, str(e), request_id
-            )
+class MCPStdioServer:
+    """MCP stdio transport server"""
 
-    async def handle_initialize(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle initialize request"""
-        request_id = request_data.get("id")
-        self.initialized = True
+    def __init__(self):
+        self.employees_mcp = get_employees_mcp()
+        self.validator = get_validator()
+        self.initialized = False
 
-        result = {
+        # initialize and tools/list results never change (listChanged: False),
+        # so serialize them once and only splice in the request id
+        self._initialize_json = orjson.dumps({
             "protocolVersion": MCP_PROTOCOL_VERSION,
             "capabilities": {
                 "tools": {"listChanged": False},
@@ -90,104 +183,193 @@ class MCPStdioServer:
                 "name": "Okta Sample Employee MCP Server",
                 "version": "1.0.0",
             },
-        }
-
-        logger.info("Client initialized")
-        return MCPProtocolHandler.create_response(result, request_id).to_dict()
+        })
+        tools = self.employees_mcp.list_tools()
+        self._tool_count = len(tools)
+        self._tools_list_json = orjson.dumps({"tools": tools}, default=json_default)
 
-    async def handle_list_tools(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle tools/list request"""
-        request_id = request_data.get("id")
+        logger.info("MCP stdio server initialized")
 
-        if not self.initialized:
+    # JSON-RPC method -> handler method name
+    _DISPATCH = {
+        "initialize": "handle_initialize",
+        "tools/list": "handle_list_tools",
+        "tools/call": "handle_tool_call",
+    }
+
+    async def handle_request(
+        self, method: str, request_id: Any, params: Optional[Dict[str, Any]]
+    ) -> Union[Dict[str, Any], bytes]:
+        """Handle JSON-RPC request (fields already pulled by _fast_envelope)"""
+        handler_name = self._DISPATCH.get(method)
+        if handler_name is None:
+            logger.warning("Unknown method: %s", method)
             return MCPProtocolHandler.error_response(
-                -32002, "Not initialized", request_id
+                -32601, f"Unknown method: {method}", request_id
             )
 
-        tools = self.employees_mcp.list_tools()
-        result = {"tools": tools}
+        try:
+            return await getattr(self, handler_name)(request_id, params)
+
+        except Exception as e:
+            # Full tracebacks only at DEBUG; formatting them is costly
+            logger.error(
+                "Error handling %s: %s (%s)", method, type(e).__name__, e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+            return MCPProtocolHandler.error_response(
+                -32603, str(e), request_id
+            )
 
-        logger.info(f"Listed {len(tools)} tools")
-        return MCPProtocolHandler.create_response(result, request_id).to_dict()
+    async def handle_initialize(self, request_id: Any, params: Optional[Dict[str, Any]]) -> bytes:
+        """Handle initialize request (returns pre-serialized response bytes)"""
+        self.initialized = True
 
-    async def handle_tool_call(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle tools/call request"""
-        request_id = request_data.get("id")
+        logger.info("Client initialized")
+        return MCPProtocolHandler.create_raw_response(self._initialize_json, request_id)
 
+    async def handle_list_tools(
+        self, request_id: Any, params: Optional[Dict[str, Any]]
+    ) -> Union[Dict[str, Any], bytes]:
+        """Handle tools/list request (returns pre-serialized response bytes)"""
         if not self.initialized:
-            return MCPProtocolHandler.error_response(
-                -32002, "Not initialized", request_id
+            return MCPProtocolHandler.create_raw_error_response(
+                _NOT_INITIALIZED_ERROR, request_id
             )
 
-        try:
-            tool_name, arguments, _ = MCPProtocolHandler.jsonrpc_to_tool_call(
-                request_data
+        logger.info("Listed %d tools", self._tool_count)
+        return MCPProtocolHandler.create_raw_response(self._tools_list_json, request_id)
+
+    async def handle_tool_call(
+        self, request_id: Any, params: Optional[Dict[str, Any]]
+    ) -> Union[Dict[str, Any], bytes]:
+        """Handle tools/call request"""
+        if not self.initialized:
+            return MCPProtocolHandler.create_raw_error_response(
+                _NOT_INITIALIZED_ERROR, request_id
             )
-        except ValueError as e:
-            logger.error(f"Invalid tool call: {e}")
-            return MCPProtocolHandler.error_response(-32602, str(e), request_id)
 
-        try:
-            # For stdio, we don't have token claims (no HTTP headers)
-            # Tools should work without Okta validation in stdio mode
-            # Or you can pass minimal claims
-            token_claims = {
-                "scope": "mcp:read mcp:write",  # Default full scope for stdio
-                "sub": "stdio-client",
-            }
+        if params is None:
+            params = {}
+        tool_name = params.get("tool_name")
+        arguments = params.get("arguments", {})
 
+        try:
+            # Tools work without Okta validation in stdio mode
             result = await self.employees_mcp.call_tool(
-                tool_name, arguments, token_claims
+                tool_name, arguments, STDIO_TOKEN_CLAIMS
             )
 
-            logger.info(f"Executed tool: {tool_name}")
-            return MCPProtocolHandler.create_response(result, request_id).to_dict()
+            logger.info("Executed tool: %s", tool_name)
+            # Static tools return a pre-serialized result; splice it in as-is
+            if isinstance(result, bytes):
+                return MCPProtocolHandler.create_raw_response(result, request_id)
+            return jsonrpc_result(result, request_id)
 
         except Exception as e:
-            logger.error(f"Error executing tool {tool_name}: {e}")
+            logger.error("Error executing tool %s: %s", tool_name, e)
             return MCPProtocolHandler.error_response(-32603, str(e), request_id)
 
+    async def _handle_line(self, line: bytes, writer, write_lock: asyncio.Lock):
+        """Handle one request line and write its response"""
+        try:
+            # Parse JSON-RPC request
+            method, request_id, params = _fast_envelope(orjson.loads(line))
+            debug = logger.isEnabledFor(logging.DEBUG)
+            if debug:
+                logger.debug("Received request: %s", method)
+
+            # Handle request
+            response = await self.handle_request(method, request_id, params)
+            if isinstance(response, bytes):
+                payload = response
+            else:
+                payload = orjson.dumps(response, default=json_default)
+            if debug:
+                logger.debug("Sent response for: %s", method)
+
+        except orjson.JSONDecodeError as e:
+            logger.error("Invalid JSON received: %s", e)
+            payload = _PARSE_ERROR_RESPONSE
+
+        except _InvalidRequest as e:
+            logger.error("Invalid request: %s", e)
+            payload = orjson.dumps(MCPProtocolHandler.error_response(
+                -32600, "Invalid Request", e.request_id
+            ))
+
+        except Exception as e:
+            logger.error(
+                "Unexpected error: %s (%s)", type(e).__name__, e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
+            payload = _INTERNAL_ERROR_RESPONSE
+
+        await self._write_line(payload, writer, write_lock)
+
+    @staticmethod
+    async def _write_line(payload: bytes, writer, write_lock: asyncio.Lock):
+        """Write one response line to stdout (payload and newline as one batch)"""
+        async with write_lock:
+            writer.writelines((payload, b"\n"))
+            await writer.drain()
+
     async def run(self):
         """Main server loop - read from stdin, write to stdout"""
         logger.info("Starting MCP stdio server")
 
-        while True:
-            try:
-                # Read line from stdin
-                line = sys.stdin.readline()
+        reader, writer = await _open_stdio()
+        write_lock = asyncio.Lock()
+        slots = asyncio.Semaphore(MAX_IN_FLIGHT)
+        in_flight: Set[asyncio.Task] = set()
+
+        def finished(task: asyncio.Task):
+            in_flight.discard(task)
+            slots.release()
 
+        while True:
+            # Read line from stdin without blocking the event loop
+            line = await _read_line(reader)
+
+            if line is None:
+                logger.error("Request line too long, discarded")
+                work = self._write_line(_PARSE_ERROR_RESPONSE, writer, write_lock)
+            elif not line:
+                # EOF - client disconnected
+                logger.info("EOF received, shutting down")
+                break
+            else:
+                line = line.strip()
                 if not line:
-                    # EOF - client disconnected
-                    logger.info("EOF received, shutting down")
-                    break
-
-                # Parse JSON-RPC request
-                request_data = json.loads(line.strip())
-                logger.debug(f"Received request: {request_data.get('method')}")
-
-                # Handle request
-                response = await self.handle_request(request_data)
-
-                # Write response to stdout
-                sys.stdout.write(json.dumps(response) + "\n")
-                sys.stdout.flush()
-                logger.debug(f"Sent response for: {request_data.get('method')}")
-
-            except json.JSONDecodeError as e:
-                logger.error(f"Invalid JSON received: {e}")
-                error = MCPProtocolHandler.error_response(
-                    -32700, "Parse error"
-                )
-                sys.stdout.write(json.dumps(error) + "\n")
-                sys.stdout.flush()
-
-            except Exception as e:
-                logger.error(f"Unexpected error: {e}", exc_info=True)
-                error = MCPProtocolHandler.error_response(
-                    -32603, "Internal server error"
-                )
-                sys.stdout.write(json.dumps(error) + "\n")
-                sys.stdout.flush()
+                    # Blank keepalive line, nothing to answer
+                    continue
+                if line[0] not in b"{[" or line[-1] not in b"}]":
+                    # Can't be a JSON-RPC message; skip the parser's exception path
+                    logger.error("Invalid JSON received: not an object or array")
+                    work = self._write_line(_PARSE_ERROR_RESPONSE, writer, write_lock)
+                else:
+                    work = self._handle_line(line, writer, write_lock)
+
+            # Handle each line as its own task so slow calls overlap, waiting
+            # for a free slot once MAX_IN_FLIGHT are outstanding. Errors for
+            # rejected lines take the same path, so they are ordered like any
+            # other reply instead of jumping ahead of queued writes
+            await slots.acquire()
+            task = asyncio.create_task(work)
+            in_flight.add(task)
+            task.add_done_callback(finished)
+
+        # Let in-flight requests finish writing before exiting
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+
+def _stdio_are_pipes() -> bool:
+    """True when neither stdin nor stdout is a regular file"""
+    try:
+        return not any(stat.S_ISREG(os.fstat(fd).st_mode) for fd in (0, 1))
+    except OSError:
+        return False
 
 
 async def main():
@@ -197,16 +379,29 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Load environment variables (only when run as the server, not on import)
+    if os.getenv("MCP_SKIP_DOTENV") != "1":
+        load_dotenv()
+
     # Validate required environment variables
     if not os.getenv("OKTA_DOMAIN"):
         logger.error("OKTA_DOMAIN environment variable is required")
         sys.exit(1)
 
+    logger.info("Okta Domain: %s", os.getenv("OKTA_DOMAIN"))
     logger.info(
-        f"Okta Domain: {os.getenv('OKTA_DOMAIN')}"
-    )
-    logger.info(
-        f"Auth Server: {os.getenv('OKTA_AUTHORIZATION_SERVER_ID', 'employee-mcp-server')}"
+        "Auth Server: %s", os.getenv("OKTA_AUTHORIZATION_SERVER_ID", "employee-mcp-server")
     )
 
+    # uvloop ships with uvicorn[standard]; use it for the pipe I/O when present.
+    # libuv aborts the process on pipe transports over regular files, before
+    # _open_stdio can fall back, so keep the default loop when stdin or stdout
+    # is redirected to a file.
+    if _stdio_are_pipes():
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
+
     asyncio.run(main())